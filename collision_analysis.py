@@ -4,36 +4,53 @@ This module performs collision analysis experiments.
 It includes functions to generate inputs, run a single collision experiment, and perform parameter sweeps.
 """
 
-import random
+import functools
 import string
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 
-def generate_random_integers(n, low=0, high=1000000):
+import numpy as np
+from numba import njit
+
+def generate_random_integers(n, low=0, high=1000000, seed=None):
     """
-    Generate a list of random integers.
+    Generate an array of random integers.
     
     Parameters:
         n (int): Number of integers to generate.
         low (int): Minimum value (inclusive).
         high (int): Maximum value (inclusive).
+        seed (int or numpy.random.Generator, optional): Seed or generator passed to numpy.random.default_rng.
         
     Returns:
-        list: List of random integers.
+        numpy.ndarray: Array of random integers (int64).
     """
-    return [random.randint(low, high) for _ in range(n)]
+    rng = np.random.default_rng(seed)
+    return rng.integers(low, high + 1, size=n, dtype=np.int64)
 
-def generate_random_strings(n, length=10):
+def generate_random_strings(n, length=10, seed=None):
     """
-    Generate a list of random strings.
+    Generate an array of random ASCII strings.
+    
+    The strings are returned as a contiguous bytes array (n * length bytes), which
+    batch hash functions can process without per-element Python objects.
     
     Parameters:
         n (int): Number of strings to generate.
         length (int): Length of each string.
+        seed (int or numpy.random.Generator, optional): Seed or generator passed to numpy.random.default_rng.
         
     Returns:
-        list: List of random strings.
+        numpy.ndarray: Array of random strings (dtype S{length}).
     """
-    characters = string.ascii_letters + string.digits
-    return [''.join(random.choices(characters, k=length)) for _ in range(n)]
+    if length == 0:
+        # A zero-width bytes dtype is not allowed; S1 zeros read back as empty strings.
+        return np.zeros(n, dtype='S1')
+    rng = np.random.default_rng(seed)
+    characters = np.frombuffer((string.ascii_letters + string.digits).encode(), dtype='S1')
+    # Draw all character indices at once, then view each row of n x length single bytes as one string.
+    idx = rng.integers(0, len(characters), size=(n, length), dtype=np.uint8)
+    return characters[idx].view(f'S{length}').ravel()
 
 def generate_structured_sequence(n):
     """
@@ -43,9 +60,9 @@ def generate_structured_sequence(n):
         n (int): Number of elements in the sequence.
         
     Returns:
-        list: List of integers.
+        numpy.ndarray: Array of integers (int64).
     """
-    return list(range(n))
+    return np.arange(n, dtype=np.int64)
 
 def get_inputs(distribution, n, **kwargs):
     """
@@ -57,7 +74,7 @@ def get_inputs(distribution, n, **kwargs):
         **kwargs: Additional keyword arguments for the generator functions.
         
     Returns:
-        list: List of generated inputs.
+        numpy.ndarray: int64 array for integer distributions, bytes array for random strings.
     """
     if distribution == "random_integers":
         return generate_random_integers(n, **kwargs)
@@ -74,44 +91,198 @@ def run_collision_experiment(hash_func, table_size, inputs, **kwargs):
     
     Parameters:
         hash_func (callable): The hash function to use. Should accept (value, table_size, **kwargs).
+                              If it has an `array` batch variant, that is used to hash all inputs at once.
         table_size (int): Size of the hash table.
-        inputs (list): List of input values.
+        inputs (list or numpy.ndarray): Input values.
         **kwargs: Additional keyword arguments to pass to the hash function.
         
     Returns:
-        dict: Results containing total collisions, collision probability, and bucket distribution.
+        dict: Results containing total collisions, collision probability, and bucket distribution
+              (bucket_counts is a numpy array of per-bucket item counts).
+    """
+    idx = _hash_indices(hash_func, table_size, inputs, **kwargs)
+    return _summarize_indices(idx, table_size)
+
+def _hash_indices(hash_func, table_size, inputs, **kwargs):
     """
-    bucket_counts = [0] * table_size
+    Map every input to its bucket index, using the batch variant of hash_func if it has one.
+    
+    Parameters:
+        hash_func (callable): The hash function to use. Should accept (value, table_size, **kwargs).
+        table_size (int): Size of the hash table.
+        inputs (list or numpy.ndarray): Input values.
+        **kwargs: Additional keyword arguments to pass to the hash function.
+        
+    Returns:
+        numpy.ndarray: Bucket indices (int64), one per input.
+    """
+    array_func = getattr(hash_func, "array", None)
+    if array_func is not None:
+        return array_func(inputs, table_size, **kwargs)
+    # Bind kwargs once rather than unpacking them on every call.
+    fn = functools.partial(hash_func, **kwargs) if kwargs else hash_func
+    return np.fromiter((fn(value, table_size) for value in inputs),
+                       dtype=np.int64, count=len(inputs))
+
+@njit(cache=True, nogil=True)
+def _count_buckets(idx, bucket_counts):
+    """
+    Compiled tally of bucket indices; runs without holding the GIL.
+    
+    Parameters:
+        idx (numpy.ndarray): Bucket indices, one per input.
+        bucket_counts (numpy.ndarray): int64 array of length table_size; zeroed and filled in place.
+        
+    Returns:
+        int: Total collisions (items landing in an already occupied bucket).
+        
+    Raises:
+        IndexError: If an index falls outside [0, table_size).
+    """
+    table_size = bucket_counts.shape[0]
+    bucket_counts[:] = 0
     collisions = 0
-    for value in inputs:
-        idx = hash_func(value, table_size, **kwargs)
-        if bucket_counts[idx] > 0:
-            collisions += 1  # A collision occurs if the bucket already has an item.
-        bucket_counts[idx] += 1
+    for i in range(idx.shape[0]):
+        bucket = idx[i]
+        if bucket < 0 or bucket >= table_size:
+            raise IndexError("bucket index out of range")
+        collisions += bucket_counts[bucket] != 0
+        bucket_counts[bucket] += 1
+    return collisions
+
+def _summarize_indices(idx, table_size):
+    """
+    Count bucket occupancy and collisions for an array of bucket indices.
+    
+    Parameters:
+        idx (numpy.ndarray): Bucket indices, one per input.
+        table_size (int): Size of the hash table.
+        
+    Returns:
+        dict: Results in the format returned by run_collision_experiment.
+    """
+    bucket_counts = np.empty(table_size, dtype=np.int64)
+    collisions = int(_count_buckets(idx, bucket_counts))
     return {
         "total_collisions": collisions,
-        "collision_probability": collisions / len(inputs),
+        "collision_probability": collisions / len(idx),
         "bucket_counts": bucket_counts
     }
 
-def run_sweep_experiments(hash_func, table_sizes, input_sizes, distribution, **gen_kwargs):
+def _prepare_inputs(hash_func, inputs):
     """
-    Run collision experiments over a sweep of table sizes and input sizes.
+    Do the table-size independent part of hashing an input set.
+    
+    If hash_func has a prehash hook, it is applied once here, so that a sweep only
+    repeats the reduction per table size; otherwise the inputs are returned unchanged.
     
     Parameters:
         hash_func (callable): The hash function to test.
+        inputs (list or numpy.ndarray): Input values.
+        
+    Returns:
+        The prehashed inputs, to be passed to _run_prepared_experiment.
+    """
+    prehash = getattr(hash_func, "prehash", None)
+    return inputs if prehash is None else prehash(inputs)
+
+def _run_prepared_experiment(hash_func, table_size, prepared):
+    """
+    Run one collision experiment on inputs returned by _prepare_inputs.
+    
+    Parameters:
+        hash_func (callable): The hash function to test.
+        table_size (int): Size of the hash table.
+        prepared: Inputs as returned by _prepare_inputs for the same hash_func.
+        
+    Returns:
+        dict: Results in the format returned by run_collision_experiment.
+    """
+    if getattr(hash_func, "prehash", None) is None:
+        idx = _hash_indices(hash_func, table_size, prepared)
+    else:
+        idx = hash_func.reduce_prehashed(prepared, table_size)
+    return _summarize_indices(idx, table_size)
+
+@dataclass
+class SweepResults:
+    """
+    Results of a parameter sweep, stored as parallel columns (one entry per experiment).
+    
+    Attributes:
+        table_sizes (numpy.ndarray): Hash table size of each experiment.
+        input_sizes (numpy.ndarray): Number of inputs of each experiment.
+        collisions (numpy.ndarray): Total collisions of each experiment.
+        collision_probs (numpy.ndarray): Collision probability of each experiment.
+        bucket_counts (dict): Bucket count arrays keyed by experiment index.
+    """
+    table_sizes: np.ndarray
+    input_sizes: np.ndarray
+    collisions: np.ndarray
+    collision_probs: np.ndarray
+    bucket_counts: dict = field(default_factory=dict)
+    
+    def __len__(self):
+        return len(self.table_sizes)
+    
+    def index(self, table_size, input_size):
+        """
+        Return the experiment index for a (table_size, input_size) pair.
+        
+        Parameters:
+            table_size (int): Hash table size of the experiment.
+            input_size (int): Number of inputs of the experiment.
+            
+        Returns:
+            int: Position of the experiment in the result arrays.
+            
+        Raises:
+            KeyError: If the pair was not part of the sweep.
+        """
+        matches = np.flatnonzero((self.table_sizes == table_size) & (self.input_sizes == input_size))
+        if matches.size == 0:
+            raise KeyError((table_size, input_size))
+        return int(matches[0])
+
+def run_sweep_experiments(hash_func, table_sizes, input_sizes, distribution, max_workers=None, **gen_kwargs):
+    """
+    Run collision experiments over a sweep of table sizes and input sizes.
+    
+    One input set is generated (and prehashed, if the hash function supports it) per
+    input size and shared by all table sizes. The experiments are independent, so
+    each (table_size, input_size) pair runs as a task in a process pool.
+    
+    Parameters:
+        hash_func (callable): The hash function to test (must be picklable, e.g. a module-level function).
         table_sizes (list): List of hash table sizes.
         input_sizes (list): List of input sizes (number of inputs).
         distribution (str): Input distribution type.
+        max_workers (int, optional): Number of worker processes (defaults to the number of CPUs).
         **gen_kwargs: Additional keyword arguments for input generation.
         
     Returns:
-        dict: Dictionary with keys as (table_size, input_size) and values as experiment results.
+        SweepResults: Per-experiment results as parallel arrays, in sweep order.
     """
+    tasks = [(table_size, input_size) for input_size in input_sizes for table_size in table_sizes]
+    
     results = {}
-    for table_size in table_sizes:
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
         for input_size in input_sizes:
-            inputs = get_inputs(distribution, input_size, **gen_kwargs)
-            result = run_collision_experiment(hash_func, table_size, inputs)
-            results[(table_size, input_size)] = result
-    return results
+            # Inputs are generated here, in sweep order, so seeded runs stay reproducible.
+            prepared = _prepare_inputs(hash_func, get_inputs(distribution, input_size, **gen_kwargs))
+            for table_size in table_sizes:
+                future = executor.submit(_run_prepared_experiment, hash_func, table_size, prepared)
+                futures[future] = len(futures)
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    # Store results in sweep order regardless of completion order.
+    ordered = [results[i] for i in range(len(tasks))]
+    return SweepResults(
+        table_sizes=np.array([table_size for table_size, _ in tasks], dtype=np.int64),
+        input_sizes=np.array([input_size for _, input_size in tasks], dtype=np.int64),
+        collisions=np.array([result["total_collisions"] for result in ordered], dtype=np.int64),
+        collision_probs=np.array([result["collision_probability"] for result in ordered], dtype=np.float64),
+        bucket_counts={i: result["bucket_counts"] for i, result in enumerate(ordered)}
+    )
@@ -5,8 +5,100 @@ It includes:
 - A simple modulo-based hash function.
 - A polynomial rolling hash function.
 - Python's built-in hash() function.
+- MurmurHash3 (32-bit) via the mmh3 C extension.
+
+Hash functions may carry a vectorized batch variant as an `array` attribute
+(attached with the `with_array_variant` decorator), which maps a whole sequence
+of inputs to a numpy array of bucket indices in one call. They may also carry a
+prehash hook (attached with `with_prehash`) that splits hashing into a part done
+once per input set and a part repeated per table size.
 """
 
+import functools
+
+import mmh3
+import numpy as np
+from numba import njit
+
+# Default base of the polynomial rolling hash.
+POLYNOMIAL_BASE = 31
+
+# Compiling a kernel specialized for one table size takes a few hundred milliseconds
+# and saves roughly that much per 1e8 hash steps, so it only pays off once a batch
+# needs this many elementary hash steps.
+_SPECIALIZE_MIN_OPS = 200_000_000
+
+def with_array_variant(array_func):
+    """
+    Decorator that attaches a batch variant to a scalar hash function.
+    
+    Parameters:
+        array_func (callable): Function accepting (values, table_size, **kwargs) and returning
+                               a numpy array of bucket indices, one per value.
+        
+    Returns:
+        callable: Decorator that sets `array_func` as the `array` attribute of the hash function.
+    """
+    def decorator(func):
+        func.array = array_func
+        return func
+    return decorator
+
+def with_prehash(prehash_func, reduce_func):
+    """
+    Decorator that attaches a prehash hook to a scalar hash function.
+    
+    Sweeps hash one input set for many table sizes. The hook lets that work be split
+    into prehash_func, run once per input set, and reduce_func, run per table size.
+    
+    Parameters:
+        prehash_func (callable): Function accepting (values) and returning the
+                                 table-size independent intermediate (must be picklable).
+        reduce_func (callable): Function accepting (prehashed, table_size) and returning
+                                a numpy array of bucket indices, one per value.
+        
+    Returns:
+        callable: Decorator that sets the `prehash` and `reduce_prehashed` attributes of the hash function.
+    """
+    def decorator(func):
+        func.prehash = prehash_func
+        func.reduce_prehashed = reduce_func
+        return func
+    return decorator
+
+def modulo_reduce(hashes, table_size):
+    """
+    Reduce full-width hash values to bucket indices.
+    
+    Parameters:
+        hashes (numpy.ndarray): Hash values (int64).
+        table_size (int): The size of the hash table.
+        
+    Returns:
+        numpy.ndarray: Bucket indices (int64), computed as hashes % table_size.
+    """
+    return np.mod(hashes, table_size)
+
+def modulo_hash_array(values, table_size):
+    """
+    Batch variant of modulo_hash.
+    
+    Integer numpy arrays are reduced with a single vectorized modulo; any other
+    input falls back to calling modulo_hash on each element.
+    
+    Parameters:
+        values (array-like): The input values to hash.
+        table_size (int): The size of the hash table.
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each input.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "iu":
+        return np.mod(values, table_size).astype(np.int64, copy=False)
+    return np.fromiter((modulo_hash(value, table_size) for value in values),
+                       dtype=np.int64, count=len(values))
+
+@with_array_variant(modulo_hash_array)
 def modulo_hash(value, table_size):
     """
     Simple modulo-based hash function.
@@ -24,26 +116,163 @@ def modulo_hash(value, table_size):
         # Fallback: use Python's built-in hash if value is not an integer.
         return hash(value) % table_size
 
-def polynomial_hash(value, table_size, base=31):
+def encode_values(values):
+    """
+    Convert input values to a 2D array of character codes.
+    
+    Each value is converted to a string (string and bytes arrays are used as-is) and
+    laid out as one zero-padded row of code points, so batch kernels can walk the
+    characters without touching Python objects. Bytes arrays are viewed in place as
+    rows of byte values, without copying.
+    
+    Parameters:
+        values (array-like): The input values to encode.
+        
+    Returns:
+        tuple: (codes, lengths) where codes is a 2D array with one row per value and
+               lengths is an int64 array with the number of characters in each row.
+    """
+    if isinstance(values, np.ndarray) and values.dtype.kind in "SU":
+        # Elements of numpy string arrays drop trailing NULs, and so does str_len.
+        strings = np.ascontiguousarray(values)
+        lengths = np.char.str_len(strings).astype(np.int64)
+    else:
+        # latin-1 maps every byte to the code point of the same value.
+        texts = [value.decode('latin-1') if isinstance(value, bytes) else str(value) for value in values]
+        # Take lengths from the Python strings: str_len would miss trailing NULs.
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        width = max(int(lengths.max()) if len(texts) else 0, 1)
+        strings = np.array(texts, dtype=f'U{width}')
+    code_dtype = np.uint8 if strings.dtype.kind == "S" else np.uint32
+    codes = strings.view(code_dtype).reshape(len(strings), strings.itemsize // np.dtype(code_dtype).itemsize)
+    return codes, lengths
+
+def _polynomial_hash_rows(codes, lengths, table_size, base):
+    """
+    Polynomial rolling hash over a batch of encoded values.
+    
+    Plain-Python loop shared by the compiled kernels below; it is never called uncompiled.
+    
+    Parameters:
+        codes (numpy.ndarray): 2D array of character codes, as produced by encode_values.
+        lengths (numpy.ndarray): Number of characters in each row of codes.
+        table_size (int): The size of the hash table.
+        base (int): The base used in the polynomial rolling hash.
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each row.
+    """
+    n = codes.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        h = 0
+        for j in range(lengths[i]):
+            h = (h * base + codes[i, j]) % table_size
+        out[i] = h
+    return out
+
+# Generic compiled kernel, taking table_size and base as runtime arguments.
+polynomial_hash_batch = njit(cache=True)(_polynomial_hash_rows)
+
+# Inlined into the specialized kernels so their constants reach the loop.
+_polynomial_hash_rows_inline = njit(inline='always')(_polynomial_hash_rows)
+
+@functools.lru_cache(maxsize=None)
+def make_polynomial_kernel(table_size, base=POLYNOMIAL_BASE):
+    """
+    Compile a polynomial_hash_batch kernel specialized for one table size and base.
+    
+    Both parameters are compile-time constants of the returned kernel, so the
+    modulo is by a known divisor. Kernels are cached per (table_size, base).
+    
+    Parameters:
+        table_size (int): The size of the hash table.
+        base (int): The base used in the polynomial rolling hash (default is POLYNOMIAL_BASE).
+        
+    Returns:
+        callable: Compiled function accepting (codes, lengths) and returning hash values (int64).
+    """
+    @njit
+    def kernel(codes, lengths):
+        return _polynomial_hash_rows_inline(codes, lengths, table_size, base)
+    return kernel
+
+def polynomial_hash_encoded(encoded, table_size, base=POLYNOMIAL_BASE):
+    """
+    Polynomial rolling hash over values already encoded by encode_values.
+    
+    Large batches run on a kernel specialized for this table size and base.
+    
+    Parameters:
+        encoded (tuple): (codes, lengths) as returned by encode_values.
+        table_size (int): The size of the hash table.
+        base (int): The base used in the polynomial rolling hash (default is POLYNOMIAL_BASE).
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each encoded value.
+    """
+    codes, lengths = encoded
+    if lengths.sum() >= _SPECIALIZE_MIN_OPS:
+        return make_polynomial_kernel(table_size, base)(codes, lengths)
+    return polynomial_hash_batch(codes, lengths, table_size, base)
+
+def polynomial_hash_array(values, table_size, base=POLYNOMIAL_BASE):
+    """
+    Batch variant of polynomial_hash.
+    
+    Parameters:
+        values (array-like): The input values to hash (each converted to string).
+        table_size (int): The size of the hash table.
+        base (int): The base used in the polynomial rolling hash (default is POLYNOMIAL_BASE).
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each input.
+    
+    Results match polynomial_hash element by element, including trailing NUL characters
+    (run with `python -m doctest hash_functions.py`):
+    
+    >>> values = ['a', 'a\\x00', b'a\\x00', 'h\\xe9llo', 12]
+    >>> polynomial_hash_array(values, 1000).tolist() == [polynomial_hash(v, 1000) for v in values]
+    True
+    """
+    return polynomial_hash_encoded(encode_values(values), table_size, base)
+
+@with_prehash(encode_values, polynomial_hash_encoded)
+@with_array_variant(polynomial_hash_array)
+def polynomial_hash(value, table_size, base=POLYNOMIAL_BASE):
     """
     Polynomial rolling hash function.
     
     This function converts the input to a string and computes a hash using a polynomial rolling approach.
+    Bytes are hashed over their byte values directly.
     
     Parameters:
-        value: The input value to hash (will be converted to string).
+        value: The input value to hash (will be converted to string unless it is bytes).
         table_size (int): The size of the hash table.
-        base (int): The base used in the polynomial rolling hash (default is 31).
+        base (int): The base used in the polynomial rolling hash (default is POLYNOMIAL_BASE).
         
     Returns:
         int: The computed hash value.
     """
-    s = str(value)
+    codes = value if isinstance(value, bytes) else map(ord, str(value))
     h = 0
-    for ch in s:
-        h = (h * base + ord(ch)) % table_size
+    for code in codes:
+        h = (h * base + code) % table_size
     return h
 
+def built_in_hash_values(values):
+    """
+    Compute Python's built-in hash() for a batch of inputs.
+    
+    Parameters:
+        values (array-like): The input values to hash.
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each input, before reduction by a table size.
+    """
+    return np.fromiter((hash(value) for value in values), dtype=np.int64, count=len(values))
+
+@with_prehash(built_in_hash_values, modulo_reduce)
 def built_in_hash(value, table_size):
     """
     Hash function using Python's built-in hash() function.
@@ -57,9 +286,62 @@ def built_in_hash(value, table_size):
     """
     return hash(value) % table_size
 
+def murmur_hash_values(values, seed=0):
+    """
+    Compute unsigned 32-bit MurmurHash3 values for a batch of inputs.
+    
+    Arrays are converted to Python objects in a single tolist() call, which for
+    contiguous bytes arrays is faster than hashing slices of the raw buffer.
+    
+    Parameters:
+        values (array-like): The input values to hash (str and bytes are hashed directly,
+                             anything else is converted to string).
+        seed (int): Seed for MurmurHash3 (default is 0).
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each input, before reduction by a table size.
+    """
+    if isinstance(values, np.ndarray):
+        values = values.tolist()
+    return np.fromiter((mmh3.hash(value if isinstance(value, (bytes, str)) else str(value), seed, signed=False)
+                        for value in values), dtype=np.int64, count=len(values))
+
+def murmur_hash_array(values, table_size, seed=0):
+    """
+    Batch variant of murmur_hash.
+    
+    Parameters:
+        values (array-like): The input values to hash.
+        table_size (int): The size of the hash table.
+        seed (int): Seed for MurmurHash3 (default is 0).
+        
+    Returns:
+        numpy.ndarray: Hash values (int64) for each input.
+    """
+    return modulo_reduce(murmur_hash_values(values, seed), table_size)
+
+@with_prehash(murmur_hash_values, modulo_reduce)
+@with_array_variant(murmur_hash_array)
+def murmur_hash(value, table_size, seed=0):
+    """
+    Hash function using 32-bit MurmurHash3 from the mmh3 C extension.
+    
+    Parameters:
+        value: The input value to hash (str and bytes are hashed directly, anything else is converted to string).
+        table_size (int): The size of the hash table.
+        seed (int): Seed for MurmurHash3 (default is 0).
+        
+    Returns:
+        int: The computed hash value.
+    """
+    if not isinstance(value, (bytes, str)):
+        value = str(value)
+    return mmh3.hash(value, seed, signed=False) % table_size
+
 # Dictionary of available hash functions for future extensibility.
 HASH_FUNCTIONS = {
     'modulo': modulo_hash,
     'polynomial': polynomial_hash,
-    'built_in': built_in_hash
+    'built_in': built_in_hash,
+    'murmur': murmur_hash
 }
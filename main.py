@@ -7,13 +7,14 @@ It then runs collision experiments and visualizes the results.
 """
 
 import argparse
+import os
 import sys
 
 def main():
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="Hash Collision Simulation and Analysis")
     parser.add_argument("--hash_function", type=str, default="built_in",
-                        choices=["modulo", "polynomial", "built_in"],
+                        choices=["modulo", "polynomial", "built_in", "murmur"],
                         help="Choose the hash function to use.")
     parser.add_argument("--table_sizes", type=str, default="10,100,1000,10000",
                         help="Comma-separated list of hash table sizes (e.g., 10,100,1000,10000).")
@@ -26,14 +27,11 @@ def main():
                         help="Length of strings if distribution is 'random_strings'.")
     parser.add_argument("--seed", type=int, default=None,
                         help="Random seed for reproducibility.")
+    parser.add_argument("--output_dir", type=str, default=None,
+                        help="Save plots as PNG files in this directory instead of showing them.")
     
     args = parser.parse_args()
     
-    # Set random seed if provided
-    if args.seed is not None:
-        import random
-        random.seed(args.seed)
-    
     # Parse table_sizes and input_sizes into lists of integers
     try:
         table_sizes = [int(x) for x in args.table_sizes.split(",")]
@@ -53,8 +51,13 @@ def main():
     # Import collision analysis functions
     from collision_analysis import run_collision_experiment, get_inputs, run_sweep_experiments
     
-    # Set up additional parameters for input generation if needed
+    # Set up additional parameters for input generation if needed.
+    # A single generator seeded once keeps the whole sweep reproducible while
+    # still drawing fresh inputs for every experiment.
+    import numpy as np
     gen_kwargs = {}
+    if args.distribution != "structured":
+        gen_kwargs["seed"] = np.random.default_rng(args.seed)
     if args.distribution == "random_strings":
         gen_kwargs["length"] = args.string_length
     
@@ -62,10 +65,20 @@ def main():
     sweep_results = run_sweep_experiments(hash_func, table_sizes, input_sizes, args.distribution, **gen_kwargs)
     
     # Print summary of results
-    for (table_size, input_size), result in sweep_results.items():
-        print(f"Hash Function: {args.hash_function}, Table Size: {table_size}, Inputs: {input_size}, "
-              f"Collisions: {result['total_collisions']}, "
-              f"Collision Probability: {result['collision_probability']:.4f}")
+    for i in range(len(sweep_results)):
+        print(f"Hash Function: {args.hash_function}, Table Size: {sweep_results.table_sizes[i]}, "
+              f"Inputs: {sweep_results.input_sizes[i]}, "
+              f"Collisions: {sweep_results.collisions[i]}, "
+              f"Collision Probability: {sweep_results.collision_probs[i]:.4f}")
+    
+    # Render off-screen when writing plots to disk; this must happen before pyplot is imported.
+    save_paths = {}
+    if args.output_dir is not None:
+        import matplotlib
+        matplotlib.use("Agg")
+        os.makedirs(args.output_dir, exist_ok=True)
+        for name in ("collisions_vs_table_size", "collision_probability_vs_input_size", "bucket_distribution"):
+            save_paths[name] = os.path.join(args.output_dir, f"{name}.png")
     
     # Import visualization functions
     from visualization import plot_collisions_vs_table_size, plot_collision_probability_vs_input_size, plot_bucket_distribution
@@ -73,16 +86,19 @@ def main():
     # Visualize results:
     # 1. Plot collisions vs. table size for the smallest input size.
     min_input_size = min(input_sizes)
-    plot_collisions_vs_table_size(sweep_results, min_input_size, args.hash_function)
+    plot_collisions_vs_table_size(sweep_results, min_input_size, args.hash_function,
+                                  save_path=save_paths.get("collisions_vs_table_size"))
     
     # 2. Plot collision probability vs. input size for the smallest table size.
     min_table_size = min(table_sizes)
-    plot_collision_probability_vs_input_size(sweep_results, min_table_size, args.hash_function)
+    plot_collision_probability_vs_input_size(sweep_results, min_table_size, args.hash_function,
+                                             save_path=save_paths.get("collision_probability_vs_input_size"))
     
     # 3. Plot bucket distribution for one experiment (e.g., smallest table size and input size).
-    experiment = sweep_results[(min_table_size, min_input_size)]
+    experiment = sweep_results.index(min_table_size, min_input_size)
     title = f'Bucket Distribution (Table Size: {min_table_size}, Inputs: {min_input_size}, Function: {args.hash_function})'
-    plot_bucket_distribution(experiment["bucket_counts"], title)
+    plot_bucket_distribution(sweep_results.bucket_counts[experiment], title,
+                             save_path=save_paths.get("bucket_distribution"))
 
 if __name__ == "__main__":
     main()
@@ -2,92 +2,121 @@
 """
 This module provides functions to visualize hash collision experiment results.
 It uses Matplotlib to generate plots for collision statistics and bucket distributions.
+
+Every plot function takes an optional save_path: when given, the figure is written
+to that file and closed instead of being shown. For headless batch runs, select a
+non-interactive backend (e.g. matplotlib.use('Agg')) before importing this module.
 """
 
+import os
+
 import matplotlib.pyplot as plt
+import numpy as np
+
+def _show_or_save(fig, save_path):
+    """
+    Show a figure interactively, or write it to save_path and release it.
+    
+    Parameters:
+        fig (matplotlib.figure.Figure): The figure to output.
+        save_path (str or None): File to save the figure to, or None to show it.
+    """
+    if save_path is None:
+        plt.show()
+    else:
+        fig.savefig(save_path, dpi=100)
+        plt.close(fig)
 
-def plot_collisions_vs_table_size(sweep_results, input_size, hash_func_name):
+def plot_collisions_vs_table_size(sweep_results, input_size, hash_func_name, save_path=None):
     """
     Plot total collisions and collision probability vs. hash table size for a fixed input size.
     
     Parameters:
-        sweep_results (dict): Dictionary with keys as (table_size, input_size) and values as experiment results.
+        sweep_results (SweepResults): Results returned by run_sweep_experiments.
         input_size (int): The fixed number of inputs used in the experiment.
         hash_func_name (str): Name of the hash function used.
+        save_path (str, optional): File for the collisions plot. The probability plot is saved
+                                   next to it with '_probability' appended to the file name.
     """
-    table_sizes = []
-    collisions = []
-    collision_probs = []
-    
-    for (table_size, n) in sweep_results:
-        if n == input_size:
-            table_sizes.append(table_size)
-            collisions.append(sweep_results[(table_size, n)]["total_collisions"])
-            collision_probs.append(sweep_results[(table_size, n)]["collision_probability"])
-    
-    # Sort data by table size
-    sorted_data = sorted(zip(table_sizes, collisions, collision_probs), key=lambda x: x[0])
-    table_sizes, collisions, collision_probs = zip(*sorted_data)
+    # Select experiments with this input size, ordered by table size
+    mask = sweep_results.input_sizes == input_size
+    order = np.argsort(sweep_results.table_sizes[mask], kind='stable')
+    table_sizes = sweep_results.table_sizes[mask][order]
+    collisions = sweep_results.collisions[mask][order]
+    collision_probs = sweep_results.collision_probs[mask][order]
     
     # Plot total collisions vs. table size
-    plt.figure()
-    plt.plot(table_sizes, collisions, marker='o')
-    plt.xlabel('Hash Table Size')
-    plt.ylabel('Total Collisions')
-    plt.title(f'Collisions vs. Table Size\n(Input Size: {input_size}, Function: {hash_func_name})')
-    plt.grid(True)
-    plt.show()
+    fig, ax = plt.subplots()
+    ax.plot(table_sizes, collisions, marker='o')
+    ax.set_xlabel('Hash Table Size')
+    ax.set_ylabel('Total Collisions')
+    ax.set_title(f'Collisions vs. Table Size\n(Input Size: {input_size}, Function: {hash_func_name})')
+    ax.grid(True)
+    _show_or_save(fig, save_path)
     
     # Plot collision probability vs. table size
-    plt.figure()
-    plt.plot(table_sizes, collision_probs, marker='x', color='red')
-    plt.xlabel('Hash Table Size')
-    plt.ylabel('Collision Probability')
-    plt.title(f'Collision Probability vs. Table Size\n(Input Size: {input_size}, Function: {hash_func_name})')
-    plt.grid(True)
-    plt.show()
+    fig, ax = plt.subplots()
+    ax.plot(table_sizes, collision_probs, marker='x', color='red')
+    ax.set_xlabel('Hash Table Size')
+    ax.set_ylabel('Collision Probability')
+    ax.set_title(f'Collision Probability vs. Table Size\n(Input Size: {input_size}, Function: {hash_func_name})')
+    ax.grid(True)
+    if save_path is not None:
+        root, ext = os.path.splitext(save_path)
+        save_path = f'{root}_probability{ext}'
+    _show_or_save(fig, save_path)
 
-def plot_collision_probability_vs_input_size(sweep_results, table_size, hash_func_name):
+def plot_collision_probability_vs_input_size(sweep_results, table_size, hash_func_name, save_path=None):
     """
     Plot collision probability vs. number of inputs for a fixed hash table size.
     
     Parameters:
-        sweep_results (dict): Dictionary with keys as (table_size, input_size) and values as experiment results.
+        sweep_results (SweepResults): Results returned by run_sweep_experiments.
         table_size (int): The fixed hash table size used in the experiment.
         hash_func_name (str): Name of the hash function used.
+        save_path (str, optional): File to save the plot to instead of showing it.
     """
-    input_sizes = []
-    collision_probs = []
+    # Select experiments with this table size, ordered by input size
+    mask = sweep_results.table_sizes == table_size
+    order = np.argsort(sweep_results.input_sizes[mask], kind='stable')
+    input_sizes = sweep_results.input_sizes[mask][order]
+    collision_probs = sweep_results.collision_probs[mask][order]
     
-    for (ts, n) in sweep_results:
-        if ts == table_size:
-            input_sizes.append(n)
-            collision_probs.append(sweep_results[(ts, n)]["collision_probability"])
-    
-    # Sort data by input size
-    sorted_data = sorted(zip(input_sizes, collision_probs), key=lambda x: x[0])
-    input_sizes, collision_probs = zip(*sorted_data)
-    
-    plt.figure()
-    plt.plot(input_sizes, collision_probs, marker='o')
-    plt.xlabel('Number of Inputs')
-    plt.ylabel('Collision Probability')
-    plt.title(f'Collision Probability vs. Input Size\n(Table Size: {table_size}, Function: {hash_func_name})')
-    plt.grid(True)
-    plt.show()
+    fig, ax = plt.subplots()
+    ax.plot(input_sizes, collision_probs, marker='o')
+    ax.set_xlabel('Number of Inputs')
+    ax.set_ylabel('Collision Probability')
+    ax.set_title(f'Collision Probability vs. Input Size\n(Table Size: {table_size}, Function: {hash_func_name})')
+    ax.grid(True)
+    _show_or_save(fig, save_path)
 
-def plot_bucket_distribution(bucket_counts, title):
+def plot_bucket_distribution(bucket_counts, title, save_path=None, max_bars=2000):
     """
     Plot the distribution of items in each bucket as a bar chart.
     
+    Large tables are downsampled: contiguous runs of buckets are summed into one bar,
+    so at most max_bars bars are drawn regardless of the table size.
+    
     Parameters:
-        bucket_counts (list): List of counts for each bucket.
+        bucket_counts (array-like): Counts for each bucket.
         title (str): Title of the plot.
+        save_path (str, optional): File to save the plot to instead of showing it.
+        max_bars (int): Maximum number of bars to draw (default is 2000).
     """
-    plt.figure(figsize=(10, 5))
-    plt.bar(range(len(bucket_counts)), bucket_counts)
-    plt.xlabel('Bucket Index')
-    plt.ylabel('Number of Items')
-    plt.title(title)
-    plt.grid(True)
-    plt.show()
+    counts = np.asarray(bucket_counts)
+    n = len(counts)
+    fig, ax = plt.subplots(figsize=(10, 5))
+    if n > max_bars:
+        chunk = -(-n // max_bars)  # ceiling division keeps the bar count within max_bars
+        starts = np.arange(0, n, chunk)
+        # The last run may be shorter than chunk; size each bar to the buckets it covers.
+        widths = np.diff(np.append(starts, n))
+        ax.bar(starts, np.add.reduceat(counts, starts), width=widths, align='edge')
+        ax.set_ylabel(f'Number of Items (per {chunk} buckets)')
+    else:
+        ax.bar(np.arange(n), counts)
+        ax.set_ylabel('Number of Items')
+    ax.set_xlabel('Bucket Index')
+    ax.set_title(title)
+    ax.grid(True)
+    _show_or_save(fig, save_path)